@@ -1,4 +1,6 @@
 from .engine import TimeSeriesEngine
 from .schema import TableSchema, ColumnSchema
+from .lifecycle import LifecycleManager
+from .cache import ReadCache
 
 __version__ = '0.1.0'
\ No newline at end of file
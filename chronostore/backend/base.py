@@ -1,21 +1,82 @@
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, List, Any, Union, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import wraps
+import json
 import struct
 import numpy as np
 import pandas as pd
 
 from ..schema import TableSchema
+from ..cache import ReadCache
+from ..predicate import Where, evaluate, predicate_key
+
+PARQUET_PARTITIONS_KEY = "chronostore.partitions"
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("pyarrow is required for Arrow/Parquet support: pip install chronostore[arrow]") from e
+    return pyarrow
+
+def cached_read(read):
+    """
+    Serve `Backend.read` results from the backend's ReadCache, if it has one.
+    Reads filtered with a callable `where`, or called with `cache=False`, are not cached.
+
+    When the backend has a cache, `read` always returns read-only arrays (cached or not),
+    so callers behave the same on hits and misses; copy them before modifying.
+    Only writes made through this backend invalidate the cache: partitions written by
+    other processes are served stale until evicted or explicitly invalidated.
+    """
+    @wraps(read)
+    def wrapper(self, table_name, date, *, start=None, end=None, where=None, cache=True):
+        if self.cache is None:
+            return read(self, table_name, date, start=start, end=end, where=where)
+
+        if not cache or (where is not None and predicate_key(where) is None):
+            return _read_only(read(self, table_name, date, start=start, end=end, where=where))
+
+        date_key = date if isinstance(date, str) else tuple(date)
+        key = (table_name, date_key, start, end, predicate_key(where))
+        data = self.cache.get(key)
+        if data is None:
+            partitions = [(table_name, d) for d in self._date_list(date_key)]
+            generations = self.cache.generations(partitions)
+            data = _read_only(read(self, table_name, date, start=start, end=end, where=where))
+            self.cache.put(key, data, partitions, generations)
+        return data
+
+    return wrapper
+
+def _read_only(data: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    for values in data.values():
+        values.flags.writeable = False
+    return data
 
 class Backend(ABC):
-    def __init__(self, schema: TableSchema):
+    # Whether partitions can be moved between storage tiers (`num_tiers`, `partition_tier`, `move_partition`)
+    supports_tiers = False
+
+    def __init__(
+        self,
+        schema: TableSchema,
+        legacy_schema: Optional[TableSchema] = None,
+        cache: Optional[ReadCache] = None,
+    ):
         self.schema = schema
+        self.legacy_schema = legacy_schema or schema
+        self.cache = cache
 
     @abstractmethod
     def append(
         self,
         table_name: str,
         date_str: str,
-        data: Union[Dict[str, Any], List[Dict[str, Any]], pd.DataFrame]
+        data: Union[Dict[str, Any], List[Dict[str, Any]], pd.DataFrame, np.ndarray]
     ) -> None:
         pass
 
@@ -27,7 +88,7 @@ class Backend(ABC):
         *,
         start: Optional[int] = None,
         end: Optional[int] = None,
-        where: Optional[Callable[[Dict[str, np.ndarray]], np.ndarray]] = None,
+        where: Optional[Where] = None,
     ) -> Dict[str, np.ndarray]:
         pass
     
@@ -37,10 +98,238 @@ class Backend(ABC):
             return pd.DataFrame()
         return pd.DataFrame(data)
 
+    def read_arrow(
+        self,
+        table_name: str,
+        date: Union[str, tuple[str, str]],
+        *,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        where: Optional[Where] = None,
+    ):
+        """
+        Read data for a day or date range as a `pyarrow.Table`, with one record batch per partition.
+
+        Contiguous columns are wrapped without copying; strided columns of the stored
+        records are gathered once.
+
+        For date ranges, `start`/`end` slice the whole range first, as `LmdbBackend.read` does
+        (`FlatFileBackend.read` ignores them for ranges). `where` then filters each partition's
+        batch separately, so a callable `where` sees one partition at a time rather than
+        the whole range as in `read`; it should only depend on each row.
+        """
+        pa = _import_pyarrow()
+        schema = self._arrow_schema()
+        if isinstance(date, str):
+            batch = self._read_batch(table_name, date, start=start, end=end, where=where)
+            return pa.Table.from_batches([batch] if batch is not None else [], schema=schema)
+
+        batches = [self._read_batch(table_name, date_str) for date_str in self._date_list(date)]
+        table = pa.Table.from_batches([b for b in batches if b is not None], schema=schema)
+        if start is not None or end is not None:
+            offset, stop, _ = slice(start, end).indices(table.num_rows)
+            table = table.slice(offset, max(stop - offset, 0))
+        if where is not None:
+            table = pa.Table.from_batches([self._filter_batch(b, where) for b in table.to_batches()], schema=schema)
+        return table
+
+    def export_parquet(
+        self,
+        table_name: str,
+        date: Union[str, tuple[str, str]],
+        path: str,
+        *,
+        where: Optional[Where] = None,
+    ) -> int:
+        """
+        Stream partitions to a Parquet file, one partition at a time.
+        The partition of each row is recorded in the file metadata for `import_parquet`.
+        Partitions are read bypassing the read cache. Return the number of rows written.
+        """
+        pa = _import_pyarrow()
+        partitions = []
+        with pa.parquet.ParquetWriter(path, self._arrow_schema()) as writer:
+            for date_str in self._date_list(date):
+                batch = self._read_batch(table_name, date_str, where=where, cache=False)
+                if batch is None or not batch.num_rows:
+                    continue
+                writer.write_batch(batch)
+                partitions.append([date_str, batch.num_rows])
+
+            writer.add_key_value_metadata({PARQUET_PARTITIONS_KEY: json.dumps(partitions)})
+
+        return sum(rows for _, rows in partitions)
+
+    def import_parquet(self, table_name: str, path: str, date: Optional[str] = None) -> int:
+        """
+        Stream a Parquet file into the table, flushing after each partition.
+
+        Rows are assigned to the partitions recorded by `export_parquet`, or all to `date`
+        if given (required for files not written by `export_parquet`).
+        Columns missing from the file, and nulls, are filled with the column's fill value.
+        Return the number of rows imported.
+        """
+        pa = _import_pyarrow()
+        parquet_file = pa.parquet.ParquetFile(path)
+
+        if date is not None:
+            partitions = [[date, parquet_file.metadata.num_rows]]
+        else:
+            metadata = parquet_file.metadata.metadata or {}
+            if PARQUET_PARTITIONS_KEY.encode() not in metadata:
+                raise ValueError(f"{path} has no partition metadata, pass `date` explicitly")
+            partitions = json.loads(metadata[PARQUET_PARTITIONS_KEY.encode()])
+
+        recorded = sum(rows for _, rows in partitions)
+        if recorded != parquet_file.metadata.num_rows:
+            raise ValueError(
+                f"{path} partition metadata covers {recorded} rows, "
+                f"but the file has {parquet_file.metadata.num_rows}"
+            )
+
+        total = 0
+        partitions_iter = iter(partitions)
+        date_str, remaining = next(partitions_iter, (None, 0))
+        for batch in parquet_file.iter_batches():
+            offset = 0
+            while offset < batch.num_rows:
+                length = min(remaining, batch.num_rows - offset)
+                if not length:
+                    raise ValueError(f"{path} has more rows than its partition metadata")
+                self.append(table_name, date_str, self._batch_to_records(batch.slice(offset, length)))
+                offset += length
+                remaining -= length
+                total += length
+                if not remaining:
+                    self.flush()
+                    date_str, remaining = next(partitions_iter, (None, 0))
+
+        self.flush()
+        return total
+
+    def _arrow_schema(self):
+        pa = _import_pyarrow()
+        return pa.schema([(name, pa.from_numpy_dtype(dtype)) for name, dtype in self.schema.numpy_dtype])
+
+    def _read_batch(self, table_name: str, date_str: str, **kwargs):
+        pa = _import_pyarrow()
+        data = self.read(table_name, date_str, **kwargs)
+        if not data:
+            return None
+        arrays = [pa.array(np.ascontiguousarray(data[name])) for name, _ in self.schema.numpy_dtype]
+        return pa.RecordBatch.from_arrays(arrays, schema=self._arrow_schema())
+
+    def _filter_batch(self, batch, where: Where):
+        pa = _import_pyarrow()
+        data = {name: batch.column(name).to_numpy(zero_copy_only=False) for name in batch.schema.names}
+        return batch.filter(pa.array(evaluate(where, data)))
+
+    def _batch_to_records(self, batch) -> np.ndarray:
+        columns = {}
+        for col, (name, dtype) in zip(self.schema.columns, self.schema.numpy_dtype):
+            if name in batch.schema.names:
+                # Nulls become the column's fill value (to_numpy would turn ints into NaN floats)
+                column = batch.column(name)
+                if column.null_count:
+                    column = column.fill_null(col.fill_value)
+                columns[name] = column.to_numpy(zero_copy_only=False)
+            else:
+                columns[name] = np.full(batch.num_rows, col.fill_value, dtype=dtype)
+        return self.schema.to_records(columns)
+
     @abstractmethod
     def flush(self) -> None:
         pass
 
+    @abstractmethod
+    def migrate_partition(self, table_name: str, date_str: str) -> None:
+        """
+        Rewrite a single partition to the current schema layout, if needed.
+        """
+        pass
+
+    def migrate(
+        self,
+        table_name: str,
+        date: Union[str, tuple[str, str]],
+        *,
+        background: bool = False,
+    ) -> Optional[Future]:
+        """
+        Rewrite partitions written with an older schema to the current layout.
+
+        Migrating is optional: old partitions are projected onto the current schema on read.
+        With `background=True`, the migration runs in a separate thread and a Future is returned.
+        """
+        def run():
+            for date_str in self._date_list(date):
+                self.migrate_partition(table_name, date_str)
+
+        if not background:
+            run()
+            return None
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(run)
+        executor.shutdown(wait=False)
+        return future
+
+    @abstractmethod
+    def list_partitions(self, table_name: str) -> List[str]:
+        """
+        Return the sorted dates of all partitions of a table.
+        """
+        pass
+
+    @abstractmethod
+    def drop_partition(self, table_name: str, date_str: str) -> None:
+        """
+        Delete a partition and everything recorded about it.
+        """
+        pass
+
+    @abstractmethod
+    def seal_partition(self, table_name: str, date_str: str, compress: bool = False) -> None:
+        """
+        Make a past partition durable and immutable, optionally compressed,
+        and precompute its column statistics. Appending to a sealed partition raises.
+        """
+        pass
+
+    @abstractmethod
+    def partition_stats(self, table_name: str, date_str: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the statistics computed when sealing a partition, or None if it isn't sealed.
+        """
+        pass
+
+    def _invalidate(self, table_name: str, date_str: str) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(table_name, date_str)
+
+    def _compute_stats(self, data: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        rows = len(next(iter(data.values()))) if data else 0
+        columns = {}
+        for name, values in data.items():
+            nulls = int(np.isnan(values).sum()) if values.dtype.kind in "fc" else 0
+            if rows - nulls:
+                minimum, maximum = np.nanmin(values).item(), np.nanmax(values).item()
+            else:
+                minimum = maximum = None
+            columns[name] = {"min": minimum, "max": maximum, "nulls": nulls}
+        return {"rows": rows, "columns": columns}
+
+    def _date_list(self, date: Union[str, tuple[str, str]]) -> List[str]:
+        if isinstance(date, str):
+            return [date]
+
+        start_dt = datetime.strptime(date[0], "%Y-%m-%d")
+        end_dt = datetime.strptime(date[1], "%Y-%m-%d")
+        return [
+            (start_dt + timedelta(days=i)).strftime("%Y-%m-%d")
+            for i in range((end_dt - start_dt).days + 1)
+        ]
+
     def pack_row(self, row: Dict[str, Any]) -> bytes:
         """
         Pack a row dict into binary format.
@@ -72,8 +361,24 @@ class Backend(ABC):
         """
         return series.to_numpy().tobytes()
 
+    def pack_records(self, records: np.ndarray) -> bytes:
+        """
+        Pack a NumPy structured array into binary format.
+        Fields are matched to the schema columns by name.
+        """
+        names = [name for name, _ in self.schema.numpy_dtype]
+        if list(records.dtype.names or ()) != names:
+            missing = [name for name in names if name not in (records.dtype.names or ())]
+            if missing:
+                raise ValueError(f"Records are missing columns: {missing}")
+            records = self.schema.to_records({name: records[name] for name in names})
+        return records.astype(self.schema.numpy_dtype, copy=False).tobytes()
+
     def pack(self, data) -> bytes:
-        if isinstance(data, pd.DataFrame):
+        if isinstance(data, np.ndarray):
+            return self.pack_records(data)
+
+        elif isinstance(data, pd.DataFrame):
             return self.pack_dataframe(data)
 
         elif isinstance(data, pd.Series):
@@ -1,48 +1,87 @@
+import io
+import json
 import os
+import shutil
+import threading
+import uuid
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List, Union, Any, Optional, Callable
+from typing import Dict, List, Union, Any, Optional, Callable, Sequence
 import numpy as np
 import pandas as pd
 
 from ...schema import TableSchema
-from ..base import Backend
+from ...cache import ReadCache
+from ...predicate import Where, evaluate
+from ..base import Backend, cached_read
 from .storage import Storage
 from .writer import Writer
 from .partitioner import Partitioner
 
 class FlatFileBackend(Backend):
-    def __init__(self, schema: TableSchema, base_dir: str, **kwargs):
+    supports_tiers = True
+
+    def __init__(
+        self,
+        schema: TableSchema,
+        base_dir: str,
+        legacy_schema: Optional[TableSchema] = None,
+        tier_dirs: Sequence[str] = (),
+        cache: Optional[ReadCache] = None,
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+        **kwargs
+    ):
         """
         Initialize the backend with a data directory and user-defined schema.
+
+        `legacy_schema` is the layout of partitions written before partition headers
+        were introduced (defaults to `schema`).
+        `tier_dirs` are secondary data directories that partitions can be moved to;
+        reads look through all of them.
+        `cache` optionally caches read results; entries of a partition are
+        invalidated when rows are appended to it through this backend
+        (writes from other processes are not detected).
+        `buffer_size` is the per-partition write buffer size.
         """
-        super().__init__(schema)
-        self.storage = Storage(schema)
-        self.partitioner = Partitioner(base_dir)
+        super().__init__(schema, legacy_schema, cache)
+        self.storage = Storage(schema, self.legacy_schema)
+        self.partitioner = Partitioner(base_dir, tier_dirs)
         self.base_dir = base_dir
+        self.buffer_size = buffer_size
         self.open_writers: Dict[str, Writer] = {}
+        self._locks: Dict[tuple[str, str], threading.RLock] = {}
+        self._locks_lock = threading.Lock()
 
     def append(
         self,
         table_name: str,
         date_str: str,
-        data: Union[Dict[str, Any], List[Dict[str, Any]], pd.DataFrame]
+        data: Union[Dict[str, Any], List[Dict[str, Any]], pd.DataFrame, np.ndarray]
     ) -> None:
         """
         Append to the day's binary file
         - a single row (dict)
         - multiple rows (list of dicts)
         - dataframe
+        - NumPy structured array
         """
-        partition_path = self.partitioner.get_partition_path(table_name, date_str)
-        os.makedirs(partition_path, exist_ok=True)
-        file_path = os.path.join(partition_path, "data.bin")
+        with self._partition_lock(table_name, date_str):
+            partition_path = self.partitioner.find_partition_path(table_name, date_str)
+            os.makedirs(partition_path, exist_ok=True)
+            file_path = os.path.join(partition_path, "data.bin")
 
-        if file_path not in self.open_writers:
-            self.open_writers[file_path] = Writer(file_path)
+            if file_path not in self.open_writers:
+                if os.path.exists(os.path.join(partition_path, "seal.json")):
+                    raise ValueError(f"Partition {table_name}/{date_str} is sealed")
+                if not os.path.exists(file_path):
+                    self.storage.write_file(file_path, np.empty(0, dtype=self.schema.numpy_dtype))
+                else:
+                    self.migrate_partition(table_name, date_str)
+                self.open_writers[file_path] = Writer(file_path, self.buffer_size)
 
-        packed = self.pack(data)
-        self.open_writers[file_path].append(packed)
+            packed = self.pack(data)
+            self.open_writers[file_path].append(packed)
+            self._invalidate(table_name, date_str)
 
     def flush(self) -> None:
         """
@@ -52,6 +91,126 @@ class FlatFileBackend(Backend):
             writer.flush()
         self.open_writers.clear()
 
+    def migrate_partition(self, table_name: str, date_str: str) -> None:
+        """
+        Rewrite the day's binary file to the current schema layout, if needed.
+        Sealed partitions are left untouched.
+        """
+        with self._partition_lock(table_name, date_str):
+            partition_path = self.partitioner.find_partition_path(table_name, date_str)
+            file_path = os.path.join(partition_path, "data.bin")
+            if not os.path.exists(file_path) or file_path in self.open_writers:
+                return
+            if os.path.exists(os.path.join(partition_path, "seal.json")):
+                return
+
+            if self.storage.read_layout(file_path).same_layout(self.schema):
+                return
+
+            columns = self.schema.project(self.storage.read_records(file_path))
+            self.storage.write_file(file_path, self.schema.to_records(columns))
+            self._invalidate(table_name, date_str)
+
+    def list_partitions(self, table_name: str) -> List[str]:
+        """
+        Return the sorted dates of all partitions of a table, across tiers.
+        """
+        return self.partitioner.list_partitions(table_name)
+
+    def drop_partition(self, table_name: str, date_str: str) -> None:
+        """
+        Delete the day's partition directory, in whichever tier it is.
+        """
+        with self._partition_lock(table_name, date_str):
+            partition_path = self.partitioner.find_partition_path(table_name, date_str)
+            self._close_writer(os.path.join(partition_path, "data.bin"))
+            if partition_path.is_dir():
+                shutil.rmtree(partition_path)
+            self._invalidate(table_name, date_str)
+
+    def seal_partition(self, table_name: str, date_str: str, compress: bool = False) -> None:
+        """
+        Flush, migrate and fsync the day's binary file, optionally compress it,
+        make it read-only and record its statistics in `seal.json`.
+        """
+        with self._partition_lock(table_name, date_str):
+            partition_path = self.partitioner.find_partition_path(table_name, date_str)
+            file_path = os.path.join(partition_path, "data.bin")
+            seal_path = os.path.join(partition_path, "seal.json")
+            if os.path.exists(seal_path) or not os.path.exists(file_path):
+                return
+
+            self._close_writer(file_path)
+            self.migrate_partition(table_name, date_str)
+
+            stats = self._compute_stats(self.storage.read_file(file_path))
+            self.storage.seal_file(file_path, compress)
+
+            seal = json.dumps({"compressed": compress, "stats": stats}).encode()
+            self.storage.write_atomic(seal_path, seal, sync=True)
+            os.chmod(seal_path, 0o444)
+            self._invalidate(table_name, date_str)
+
+    def partition_stats(self, table_name: str, date_str: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the statistics recorded when the partition was sealed, or None.
+        """
+        partition_path = self.partitioner.find_partition_path(table_name, date_str)
+        seal_path = os.path.join(partition_path, "seal.json")
+        if not os.path.exists(seal_path):
+            return None
+        with open(seal_path) as f:
+            return json.load(f)["stats"]
+
+    @property
+    def num_tiers(self) -> int:
+        """
+        Number of storage tiers, including `base_dir` (tier 0).
+        """
+        return len(self.partitioner.tiers)
+
+    def partition_tier(self, table_name: str, date_str: str) -> int:
+        """
+        Return the tier holding the day's partition, or -1 if it doesn't exist.
+        """
+        return self.partitioner.find_tier(table_name, date_str)
+
+    def move_partition(self, table_name: str, date_str: str, tier: int) -> None:
+        """
+        Move the day's partition directory to another tier.
+
+        The partition is copied under a temporary name, renamed into place,
+        then removed from its previous tier, so it stays readable throughout.
+        """
+        target = self.partitioner.get_partition_path(table_name, date_str, tier)
+        with self._partition_lock(table_name, date_str):
+            source_tier = self.partitioner.find_tier(table_name, date_str)
+            if source_tier in (-1, tier):
+                return
+
+            source = self.partitioner.get_partition_path(table_name, date_str, source_tier)
+            self._close_writer(os.path.join(source, "data.bin"))
+
+            tmp_target = target.with_name(f"{target.name}.{uuid.uuid4().hex}.tmp")
+            os.makedirs(target.parent, exist_ok=True)
+            shutil.copytree(source, tmp_target)
+            os.replace(tmp_target, target)
+            shutil.rmtree(source)
+            self._invalidate(table_name, date_str)
+
+    def _partition_lock(self, table_name: str, date_str: str) -> threading.RLock:
+        """
+        Lock serializing writes, migrations, seals and moves of a partition.
+        """
+        with self._locks_lock:
+            return self._locks.setdefault((table_name, date_str), threading.RLock())
+
+    def _close_writer(self, file_path: str) -> None:
+        writer = self.open_writers.pop(file_path, None)
+        if writer is not None:
+            writer.flush()
+
+    @cached_read
     def read(
         self,
         table_name: str,
@@ -59,20 +218,33 @@ class FlatFileBackend(Backend):
         *,
         start: Optional[int] = None,
         end: Optional[int] = None,
-        where: Optional[Callable[[Dict[str, np.ndarray]], np.ndarray]] = None,
+        where: Optional[Where] = None,
     ) -> Dict[str, np.ndarray]:
         """
         Read data for a day or date range.
 
         - `date`: a single date ("YYYY-MM-DD") or a tuple (start_date, end_date).
         - `start` and `end`: optional slice indices (only applies to single day read).
-        - `where`: optional filter function that takes a dict of columns and returns a boolean mask.
+        - `where`: optional filter function that takes a dict of columns and returns a boolean mask,
+          or a declarative predicate such as `("delta", ">", 0)` (cacheable).
         """
         if isinstance(date, str):
             # Single day read
-            partition_path = self.partitioner.get_partition_path(table_name, date)
+            partition_path = self.partitioner.find_partition_path(table_name, date)
             file_path = os.path.join(partition_path, "data.bin")
-            data = self.storage.read_file(file_path, start, end)
+
+            # Include rows still buffered by an open writer, without flushing it
+            writer = self.open_writers.get(file_path)
+            if writer is not None:
+                size, pending_size = writer.snapshot()
+                data = self.storage.read_file(
+                    file_path, start, end,
+                    size=size,
+                    pending_size=pending_size,
+                    read_pending=lambda offset, length: writer.read_pending(size, offset, length),
+                )
+            else:
+                data = self.storage.read_file(file_path, start, end)
         else:
             # Date range read
             start_dt = datetime.strptime(date[0], "%Y-%m-%d")
@@ -97,7 +269,7 @@ class FlatFileBackend(Backend):
 
         # Apply optional filtering
         if where and data:
-            mask = where(data)
+            mask = evaluate(where, data)
             data = {k: v[mask] for k, v in data.items()}
 
         return data
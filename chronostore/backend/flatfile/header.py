@@ -0,0 +1,34 @@
+import json
+import struct
+from typing import BinaryIO, Optional, Tuple
+
+from ...schema import TableSchema
+
+MAGIC = b"\x93CHRONO\x00"
+HEADER_ALIGNMENT = 64
+
+def encode_header(schema: TableSchema) -> bytes:
+    """
+    Encode the partition header: magic, payload length and the JSON layout,
+    padded so that records start on an aligned offset.
+    """
+    payload = json.dumps(schema.to_dict()).encode()
+    size = len(MAGIC) + 4 + len(payload)
+    padding = -size % HEADER_ALIGNMENT
+    payload += b" " * padding
+    return MAGIC + struct.pack("<I", len(payload)) + payload
+
+def read_header(f: BinaryIO) -> Tuple[Optional[TableSchema], int]:
+    """
+    Read the partition header from the start of a file.
+    Return the recorded schema and the offset of the first record,
+    or (None, 0) for header-less (legacy) files.
+    """
+    f.seek(0)
+    prefix = f.read(len(MAGIC) + 4)
+    if len(prefix) < len(MAGIC) + 4 or prefix[:len(MAGIC)] != MAGIC:
+        return None, 0
+
+    (length,) = struct.unpack("<I", prefix[len(MAGIC):])
+    payload = f.read(length)
+    return TableSchema.from_dict(json.loads(payload)), len(prefix) + length
@@ -1,11 +1,50 @@
 from pathlib import Path
+from typing import List, Sequence
 
 class Partitioner:
-    def __init__(self, base_dir: str):
+    def __init__(self, base_dir: str, tier_dirs: Sequence[str] = ()):
+        """
+        `tier_dirs` are secondary (e.g. colder, cheaper) base directories
+        that partitions can be moved to. Tier 0 is `base_dir`.
+        """
         self.base_dir = Path(base_dir)
+        self.tiers = [self.base_dir] + [Path(d) for d in tier_dirs]
 
-    def get_partition_path(self, table_name: str, date_str: str) -> Path:
+    def get_partition_path(self, table_name: str, date_str: str, tier: int = 0) -> Path:
         """
         Return the directory path for a given table_name and date.
         """
-        return self.base_dir / table_name / date_str
\ No newline at end of file
+        if not 0 <= tier < len(self.tiers):
+            raise ValueError(f"Unknown tier: {tier} (there are {len(self.tiers)})")
+        return self.tiers[tier] / table_name / date_str
+
+    def find_partition_path(self, table_name: str, date_str: str) -> Path:
+        """
+        Return the directory path of an existing partition, looking through all tiers.
+        Defaults to the tier 0 path if the partition doesn't exist yet.
+        """
+        for tier in range(len(self.tiers)):
+            path = self.get_partition_path(table_name, date_str, tier)
+            if path.is_dir():
+                return path
+        return self.get_partition_path(table_name, date_str)
+
+    def find_tier(self, table_name: str, date_str: str) -> int:
+        """
+        Return the tier holding a partition, or -1 if it doesn't exist.
+        """
+        for tier in range(len(self.tiers)):
+            if self.get_partition_path(table_name, date_str, tier).is_dir():
+                return tier
+        return -1
+
+    def list_partitions(self, table_name: str) -> List[str]:
+        """
+        Return the sorted dates of all partitions of a table, across tiers.
+        """
+        dates = set()
+        for tier_dir in self.tiers:
+            table_dir = tier_dir / table_name
+            if table_dir.is_dir():
+                dates.update(p.name for p in table_dir.iterdir() if p.is_dir() and not p.name.endswith(".tmp"))
+        return sorted(dates)
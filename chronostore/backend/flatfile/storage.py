@@ -1,26 +1,146 @@
 import numpy as np
+import io
 import mmap
 import os
-from typing import Dict, Optional
+import uuid
+import zlib
+from typing import Callable, Dict, Optional
 
 from ...schema import TableSchema
+from .header import encode_header, read_header
 
 class Storage:
-    def __init__(self, schema: TableSchema):
+    def __init__(self, schema: TableSchema, legacy_schema: Optional[TableSchema] = None):
         """
         Storage handles packing and reading records using the provided TableSchema.
+
+        `legacy_schema` is the layout assumed for files written without a header
+        (defaults to `schema`).
         """
         self.schema = schema
+        self.legacy_schema = legacy_schema or schema
 
-    def read_file(self, path: str, start: Optional[int] = None, end: Optional[int] = None) -> Dict[str, np.ndarray]:
+    def exists(self, path: str) -> bool:
         """
-        Read binary records from a file, return as dict of NumPy arrays.
+        Whether a file exists, either plain or compressed.
+        """
+        return os.path.exists(path) or os.path.exists(f"{path}.z")
+
+    def read_layout(self, path: str) -> TableSchema:
+        """
+        Return the schema a file was written with.
+        """
+        with self._open(path) as f:
+            layout, _ = read_header(f)
+        return layout or self.legacy_schema
+
+    def read_records(self, path: str, size: Optional[int] = None) -> np.ndarray:
+        """
+        Memory-map a file and return its whole records in the file's own layout.
+        Compressed files are decompressed in memory instead.
         """
         if not os.path.exists(path):
-            return {}
+            raw = self._decompress(path)
+            layout, offset = read_header(io.BytesIO(raw))
+            dtype = np.dtype((layout or self.legacy_schema).numpy_dtype)
+            count = (len(raw) - offset) // dtype.itemsize
+            return np.frombuffer(raw, dtype=dtype, count=count, offset=offset)
 
         with open(path, "rb") as f:
+            layout, offset = read_header(f)
+            dtype = np.dtype((layout or self.legacy_schema).numpy_dtype)
+
+            file_size = os.fstat(f.fileno()).st_size
+            if size is not None:
+                file_size = min(file_size, size)
+            count = max(file_size - offset, 0) // dtype.itemsize
+
+            if not count:
+                return np.empty(0, dtype=dtype)
             mm = mmap.mmap(f.fileno(), length=0, access=mmap.ACCESS_READ)
-            records = np.frombuffer(mm, dtype=self.schema.numpy_dtype)
-            sliced = records[start:end]
-            return {name: sliced[name] for name, _ in self.schema.numpy_dtype}
\ No newline at end of file
+            return np.frombuffer(mm, dtype=dtype, count=count, offset=offset)
+
+    def read_file(
+        self,
+        path: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        *,
+        size: Optional[int] = None,
+        pending_size: int = 0,
+        read_pending: Optional[Callable[[int, int], bytes]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Read binary records from a file, return as dict of NumPy arrays.
+
+        - `size`: optional number of bytes of the file to consider (defaults to the whole file).
+        - `pending_size`: number of bytes not yet written to the file, logically appended after it.
+        - `read_pending`: callable `(offset, length)` returning those pending bytes.
+
+        A trailing partial record (e.g. from a concurrent writer) is ignored.
+        Files written with an older schema are projected onto the current one.
+        The result is a zero-copy view unless the slice reaches into the pending
+        rows (only those are copied) or a column had to be cast or filled.
+        """
+        if not self.exists(path):
+            return {}
+
+        records = self.read_records(path, size)
+        count = len(records)
+
+        itemsize = records.dtype.itemsize
+        pending_count = pending_size // itemsize if read_pending else 0
+        sl_start, sl_end, _ = slice(start, end).indices(count + pending_count)
+
+        if sl_end <= count or not pending_count:
+            sliced = records[sl_start:sl_end]
+        else:
+            first = max(sl_start - count, 0)
+            raw = read_pending(first * itemsize, max(sl_end - count - first, 0) * itemsize)
+            buffered = np.frombuffer(raw, dtype=records.dtype)
+            sliced = np.concatenate((records[sl_start:count], buffered))
+
+        return self.schema.project(sliced)
+
+    def write_file(self, path: str, records: np.ndarray) -> None:
+        """
+        Atomically (re)write a file with a header for the current schema followed by `records`.
+        """
+        self.write_atomic(path, encode_header(self.schema) + records.tobytes())
+
+    def seal_file(self, path: str, compress: bool = False) -> None:
+        """
+        Make a file durable and read-only, optionally replacing it with a
+        zlib-compressed copy (`<path>.z`).
+        """
+        if compress:
+            with open(path, "rb") as f:
+                compressed = zlib.compress(f.read())
+            self.write_atomic(f"{path}.z", compressed, sync=True)
+            os.remove(path)
+            path = f"{path}.z"
+        else:
+            with open(path, "rb") as f:
+                os.fsync(f.fileno())
+        os.chmod(path, 0o444)
+
+    def _open(self, path: str):
+        if os.path.exists(path):
+            return open(path, "rb")
+        return io.BytesIO(self._decompress(path))
+
+    def _decompress(self, path: str) -> bytes:
+        with open(f"{path}.z", "rb") as f:
+            return zlib.decompress(f.read())
+
+    def write_atomic(self, path: str, content: bytes, sync: bool = False) -> None:
+        """
+        Write `content` to a uniquely named temporary file, then rename it to `path`.
+        """
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "xb") as f:
+            f.write(content)
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
@@ -1,21 +1,67 @@
-from typing import BinaryIO
+import io
+import os
+import threading
+from typing import BinaryIO, Tuple
 
 class Writer:
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, buffer_size: int = io.DEFAULT_BUFFER_SIZE):
         """
         Append-only writer for binary data.
+
+        Appended bytes are kept in an in-process buffer until it reaches
+        `buffer_size`, so readers can snapshot them without forcing a write.
+        The default matches Python's file buffering. A larger buffer means fewer
+        writes, but other processes see rows later and a crash loses more of them.
         """
-        self.file: BinaryIO = open(file_path, "ab")
+        self.file_path = file_path
+        self.file: BinaryIO = open(file_path, "ab", buffering=0)
+        self.buffer_size = buffer_size
+        self._buffer = bytearray()
+        self._written = os.fstat(self.file.fileno()).st_size
+        self._lock = threading.Lock()
 
     def append(self, packed_bytes: bytes) -> None:
         """
-        Write packed bytes to file.
+        Buffer packed bytes, writing them to file once the buffer is full.
         """
-        self.file.write(packed_bytes)
+        with self._lock:
+            self._buffer += packed_bytes
+            if len(self._buffer) >= self.buffer_size:
+                self._write_buffer()
+
+    def snapshot(self) -> Tuple[int, int]:
+        """
+        Return the number of bytes written to file and the number of pending bytes.
+        Both values are taken atomically, so together they form a consistent view.
+        """
+        with self._lock:
+            return self._written, len(self._buffer)
+
+    def read_pending(self, written: int, offset: int, length: int) -> bytes:
+        """
+        Copy `length` pending bytes at `offset` of the snapshot taken when `written` bytes
+        were on file. If that buffer has since been written out, read the bytes from file.
+        """
+        with self._lock:
+            if self._written == written:
+                return bytes(self._buffer[offset:offset + length])
+
+        with open(self.file_path, "rb") as f:
+            f.seek(written + offset)
+            return f.read(length)
 
     def flush(self) -> None:
         """
         Flush and close the file handle.
         """
-        self.file.flush()
-        self.file.close()
\ No newline at end of file
+        with self._lock:
+            self._write_buffer()
+            self.file.close()
+
+    def _write_buffer(self) -> None:
+        offset = 0
+        with memoryview(self._buffer) as view:
+            while offset < len(view):
+                offset += self.file.write(view[offset:])
+        self._written += len(self._buffer)
+        self._buffer.clear()
@@ -1,3 +1,5 @@
+import json
+import zlib
 import lmdb
 import pandas as pd
 import numpy as np
@@ -5,16 +7,31 @@ from datetime import datetime, timedelta
 from collections import defaultdict
 from typing import Union, Dict, List, Any, Optional, Callable
 
-from .base import Backend
+from .base import Backend, cached_read
 from ..schema import TableSchema
+from ..cache import ReadCache
+from ..predicate import Where, evaluate
 
 
 class LmdbBackend(Backend):
-    def __init__(self, schema: TableSchema, base_dir: str, **kwargs):
+    def __init__(
+        self,
+        schema: TableSchema,
+        base_dir: str,
+        legacy_schema: Optional[TableSchema] = None,
+        cache: Optional[ReadCache] = None,
+        **kwargs
+    ):
         """
         Initialize the backend with a data directory and user-defined schema.
+
+        `legacy_schema` is the layout of partitions written before partition layouts
+        were recorded (defaults to `schema`).
+        `cache` optionally caches read results; entries of a partition are
+        invalidated when buffered rows are flushed to it through this backend
+        (writes from other processes are not detected).
         """
-        super().__init__(schema)
+        super().__init__(schema, legacy_schema, cache)
 
         kwargs.setdefault('max_dbs', 1)
         kwargs.setdefault('map_size', 64 * 1024 ** 3) # Default to 64 GiB
@@ -30,26 +47,137 @@ class LmdbBackend(Backend):
     def _row_key(self, table: str, date_str: str, counter: int) -> bytes:
         return f"{table}:{date_str}:{counter:06d}".encode()
 
+    def _schema_key(self, table: str, date_str: str) -> bytes:
+        return f"__schema__:{table}:{date_str}".encode()
+
+    def _read_layout(self, txn, table: str, date_str: str) -> TableSchema:
+        raw = txn.get(self._schema_key(table, date_str))
+        if raw is None:
+            return self.legacy_schema
+        return TableSchema.from_dict(json.loads(raw))
+
+    def _write_layout(self, txn, table: str, date_str: str) -> None:
+        txn.put(self._schema_key(table, date_str), json.dumps(self.schema.to_dict()).encode())
+
+    def _seal_key(self, table: str, date_str: str) -> bytes:
+        return f"__seal__:{table}:{date_str}".encode()
+
+    def _read_seal(self, txn, table: str, date_str: str) -> Optional[Dict[str, Any]]:
+        raw = txn.get(self._seal_key(table, date_str))
+        return None if raw is None else json.loads(raw)
+
+    def _records(self, raw: bytes, layout: TableSchema) -> np.ndarray:
+        dtype = np.dtype(layout.numpy_dtype)
+        return np.frombuffer(raw, dtype=dtype, count=len(raw) // dtype.itemsize)
+
+    def _load(self, txn, table: str, date_str: str) -> Optional[np.ndarray]:
+        raw = txn.get(f"{table}:{date_str}".encode())
+        if raw is None:
+            return None
+
+        seal = self._read_seal(txn, table, date_str)
+        if seal is not None and seal["compressed"]:
+            raw = zlib.decompress(raw)
+        return self._records(raw, self._read_layout(txn, table, date_str))
+
     def read_partition(self, table_name, date_str, start=None, end=None):
-        key = f"{table_name}:{date_str}".encode()
         with self.env.begin() as txn:
-           raw = txn.get(key)
-           if raw is None:
+           arr = self._load(txn, table_name, date_str)
+           if arr is None:
                return {}
 
-        arr = np.frombuffer(raw, dtype=self.schema.numpy_dtype)
         sliced = arr[start:end]
-        return {name: sliced[name] for name, _ in self.schema.numpy_dtype}
+        return self.schema.project(sliced)
+
+    def list_partitions(self, table_name: str) -> List[str]:
+        prefix = f"{table_name}:".encode()
+        dates = []
+        with self.env.begin() as txn:
+            cursor = txn.cursor()
+            if cursor.set_range(prefix):
+                for key in cursor.iternext(values=False):
+                    if not key.startswith(prefix):
+                        break
+                    dates.append(key[len(prefix):].decode())
+        return dates
+
+    def drop_partition(self, table_name: str, date_str: str) -> None:
+        """
+        Delete the day's value and metadata. Freed pages are reused by later writes.
+        """
+        self._buffers.pop((table_name, date_str), None)
+        with self.env.begin(write=True) as txn:
+            txn.delete(f"{table_name}:{date_str}".encode())
+            txn.delete(self._schema_key(table_name, date_str))
+            txn.delete(self._seal_key(table_name, date_str))
+        self._invalidate(table_name, date_str)
+
+    def seal_partition(self, table_name: str, date_str: str, compress: bool = False) -> None:
+        """
+        Migrate the day's value to the current layout, optionally compress it,
+        record its statistics and sync the environment to disk.
+        """
+        if self._buffers.get((table_name, date_str)):
+            self.flush()
+
+        key = f"{table_name}:{date_str}".encode()
+        with self.env.begin(write=True) as txn:
+            records = self._load(txn, table_name, date_str)
+            if records is None or self._read_seal(txn, table_name, date_str) is not None:
+                return
+
+            columns = self.schema.project(records)
+            value = self.schema.to_records(columns).tobytes()
+            txn.put(key, zlib.compress(value) if compress else value)
+            self._write_layout(txn, table_name, date_str)
+
+            seal = {"compressed": compress, "stats": self._compute_stats(columns)}
+            txn.put(self._seal_key(table_name, date_str), json.dumps(seal).encode())
+
+        self.env.sync(True)
+        self._invalidate(table_name, date_str)
+
+    def partition_stats(self, table_name: str, date_str: str) -> Optional[Dict[str, Any]]:
+        with self.env.begin() as txn:
+            seal = self._read_seal(txn, table_name, date_str)
+        return None if seal is None else seal["stats"]
+
+    def migrate_partition(self, table_name: str, date_str: str) -> None:
+        """
+        Rewrite the day's value to the current schema layout, if needed.
+        """
+        key = f"{table_name}:{date_str}".encode()
+        with self.env.begin(write=True) as txn:
+            raw = txn.get(key)
+            if raw is None or self._read_seal(txn, table_name, date_str) is not None:
+                return
+
+            layout = self._read_layout(txn, table_name, date_str)
+            if layout.same_layout(self.schema):
+                return
+
+            columns = self.schema.project(self._records(raw, layout))
+            txn.put(key, self.schema.to_records(columns).tobytes())
+            self._write_layout(txn, table_name, date_str)
+        self._invalidate(table_name, date_str)
 
     def append(
         self,
         table_name: str,
         date_str: str,
-        data: Union[Dict[str, Any], List[Dict[str, Any]], pd.DataFrame]
+        data: Union[Dict[str, Any], List[Dict[str, Any]], pd.DataFrame, np.ndarray]
     ) -> None:
+        """
+        Buffer rows until `flush`. Appending to a sealed partition raises.
+        """
         key = (table_name, date_str)
+        if key not in self._buffers:
+            with self.env.begin() as txn:
+                if self._read_seal(txn, table_name, date_str) is not None:
+                    raise ValueError(f"Partition {table_name}/{date_str} is sealed")
         self._buffers[key].append(data)
 
+    @cached_read
     def read(
         self,
         table_name: str,
@@ -57,7 +185,7 @@ class LmdbBackend(Backend):
         *,
         start: Optional[int] = None,
         end: Optional[int] = None,
-        where: Optional[Callable[[Dict[str, np.ndarray]], np.ndarray]] = None,
+        where: Optional[Where] = None,
     ) -> Dict[str, np.ndarray]:
 
         if isinstance(date, str):
@@ -74,7 +202,7 @@ class LmdbBackend(Backend):
 
             all_data: Dict[str, list] = {name: [] for name, _ in self.schema.numpy_dtype}
             for date_str in date_list:
-                day_data = self.read_partition(table_name, date_str)
+                day_data = self.read(table_name, date_str)
                 for name, values in day_data.items():
                     all_data[name].append(values)
 
@@ -87,26 +215,46 @@ class LmdbBackend(Backend):
 
             # Apply filtering
         if where and data:
-            mask = where(data)
+            mask = evaluate(where, data)
             data = {name: arr[mask] for name, arr in data.items()}
 
         return data
 
     def flush(self) -> None:
+        """
+        Write buffered rows. Rows buffered for a partition sealed since they were
+        appended are dropped and reported with a ValueError, once the others are written.
+        """
+        sealed = []
         with self.env.begin(write=True) as txn:
             for (table_name, date_str), rows in self._buffers.items():
                 if not rows:
                     continue
 
+                if self._read_seal(txn, table_name, date_str) is not None:
+                    sealed.append(f"{table_name}/{date_str}")
+                    continue
+
                 key = f"{table_name}:{date_str}".encode()
                 new_data = b"".join(self.pack(row) for row in rows)
 
                 existing = txn.get(key)
                 if existing:
+                    layout = self._read_layout(txn, table_name, date_str)
+                    if not layout.same_layout(self.schema):
+                        # Bring the partition to the current layout before appending to it
+                        columns = self.schema.project(self._records(existing, layout))
+                        existing = self.schema.to_records(columns).tobytes()
                     combined = existing + new_data
                 else:
                     combined = new_data
 
                 txn.put(key, combined)
+                self._write_layout(txn, table_name, date_str)
+
+        for table_name, date_str in self._buffers:
+            self._invalidate(table_name, date_str)
+        self._buffers.clear()
 
-        self._buffers.clear()
\ No newline at end of file
+        if sealed:
+            raise ValueError(f"Partitions are sealed: {', '.join(sealed)}")
\ No newline at end of file
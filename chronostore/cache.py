@@ -0,0 +1,122 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, Optional, Set, Tuple
+import numpy as np
+
+DEFAULT_MAX_BYTES = 256 * 1024 ** 2  # 256 MiB
+
+class ReadCache:
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Bounded in-process cache of read results, evicted LRU by size in bytes.
+
+        Entries are registered against the partitions they were read from,
+        so they can be invalidated when those partitions change. Backends only
+        invalidate on their own writes: partitions written by other processes
+        are served stale until evicted or explicitly invalidated.
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._bytes = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Dict[str, np.ndarray], int, Tuple[tuple, ...]]]" = OrderedDict()
+        self._partitions: Dict[tuple, Set[Hashable]] = {}
+        self._generations: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Return a cached result, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[0])
+
+    def generations(self, partitions: Iterable[tuple]) -> Tuple[int, ...]:
+        """
+        Return the invalidation generations of `partitions`, to be passed to `put`.
+        """
+        with self._lock:
+            return tuple(self._generations.get(partition, 0) for partition in partitions)
+
+    def put(
+        self,
+        key: Hashable,
+        data: Dict[str, np.ndarray],
+        partitions: Iterable[tuple],
+        generations: Optional[Tuple[int, ...]] = None,
+    ) -> None:
+        """
+        Cache a result read from `partitions` (a list of (table_name, date_str)).
+
+        `generations`, taken before reading, guards against caching a stale result:
+        if any partition was invalidated since, the result is not kept.
+        Cached arrays are shared with callers and must not be modified: `Backend.read`
+        makes them read-only. Results larger than the cache are not kept.
+        """
+        partitions = tuple(partitions)
+        size = sum(values.nbytes for values in data.values())
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            current = tuple(self._generations.get(partition, 0) for partition in partitions)
+            if generations is not None and current != generations:
+                return
+
+            self._remove(key)
+            self._entries[key] = (dict(data), size, partitions)
+            self._bytes += size
+            for partition in partitions:
+                self._partitions.setdefault(partition, set()).add(key)
+
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, table_name: str, date_str: str) -> None:
+        """
+        Drop every entry read from a partition.
+        """
+        with self._lock:
+            partition = (table_name, date_str)
+            self._generations[partition] = self._generations.get(partition, 0) + 1
+            for key in list(self._partitions.get(partition, ())):
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._partitions.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return hit/miss counters and current usage.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        _, size, partitions = entry
+        self._bytes -= size
+        for partition in partitions:
+            keys = self._partitions.get(partition)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._partitions[partition]
@@ -0,0 +1,69 @@
+from datetime import date, datetime
+from typing import Dict, List, Optional, Union
+
+from .backend.base import Backend
+from .engine import TimeSeriesEngine
+
+class LifecycleManager:
+    def __init__(
+        self,
+        backend: Union[Backend, TimeSeriesEngine],
+        *,
+        retention_days: Optional[int] = None,
+        seal_after_days: Optional[int] = None,
+        tier_after_days: Optional[int] = None,
+        cold_tier: int = 1,
+        compress: bool = False,
+    ):
+        """
+        Apply time-based lifecycle policies to the partitions of a backend.
+
+        - `retention_days`: partitions older than this many days are dropped.
+        - `seal_after_days`: partitions at least this many days old are sealed
+          (durable, immutable, optionally compressed, with precomputed stats).
+        - `tier_after_days`: partitions at least this many days old are sealed
+          and moved to `cold_tier` (only for backends supporting tiers).
+        """
+        if isinstance(backend, TimeSeriesEngine):
+            backend = backend.backend
+        if tier_after_days is not None:
+            if not backend.supports_tiers:
+                raise ValueError(f"{type(backend).__name__} does not support storage tiers")
+            if not 0 <= cold_tier < backend.num_tiers:
+                raise ValueError(f"Unknown cold tier: {cold_tier} (backend has {backend.num_tiers} tiers)")
+
+        self.backend = backend
+        self.retention_days = retention_days
+        self.seal_after_days = seal_after_days
+        self.tier_after_days = tier_after_days
+        self.cold_tier = cold_tier
+        self.compress = compress
+
+    def run(self, table_name: str, today: Optional[str] = None) -> Dict[str, List[str]]:
+        """
+        Apply the policies to a table, relative to `today` (defaults to the current date).
+        Return the dates of the partitions that were dropped, sealed and moved.
+        """
+        today_dt = datetime.strptime(today, "%Y-%m-%d").date() if today else date.today()
+        actions: Dict[str, List[str]] = {"dropped": [], "sealed": [], "moved": []}
+
+        for date_str in self.backend.list_partitions(table_name):
+            age = (today_dt - datetime.strptime(date_str, "%Y-%m-%d").date()).days
+
+            if self.retention_days is not None and age > self.retention_days:
+                self.backend.drop_partition(table_name, date_str)
+                actions["dropped"].append(date_str)
+                continue
+
+            seal = self.seal_after_days is not None and age >= self.seal_after_days
+            move = self.tier_after_days is not None and age >= self.tier_after_days
+
+            if (seal or move) and self.backend.partition_stats(table_name, date_str) is None:
+                self.backend.seal_partition(table_name, date_str, compress=self.compress)
+                actions["sealed"].append(date_str)
+
+            if move and self.backend.partition_tier(table_name, date_str) != self.cold_tier:
+                self.backend.move_partition(table_name, date_str, self.cold_tier)
+                actions["moved"].append(date_str)
+
+        return actions
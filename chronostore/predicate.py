@@ -0,0 +1,50 @@
+import operator
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+Condition = Tuple[str, str, Any]
+Predicate = Union[Condition, List[Condition]]
+Where = Union[Callable[[Dict[str, np.ndarray]], np.ndarray], Predicate]
+
+OPERATORS: Dict[str, Callable[[np.ndarray, Any], np.ndarray]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": np.isin,
+    "not in": lambda values, other: ~np.isin(values, other),
+}
+
+def _conditions(where: Predicate) -> List[Condition]:
+    return [where] if isinstance(where, tuple) else list(where)
+
+def predicate_key(where: Optional[Where]) -> Optional[tuple]:
+    """
+    Return a hashable key for a declarative predicate, or None for callables.
+    """
+    if where is None or callable(where):
+        return None
+    return tuple(
+        (column, op, tuple(value) if isinstance(value, (list, set, np.ndarray)) else value)
+        for column, op, value in _conditions(where)
+    )
+
+def evaluate(where: Where, data: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Compute the boolean mask of a `where` filter.
+
+    `where` is either a function taking a dict of columns, or a declarative predicate:
+    a `(column, op, value)` tuple or a list of them, combined with AND.
+    """
+    if callable(where):
+        return where(data)
+
+    mask = None
+    for column, op, value in _conditions(where):
+        if op not in OPERATORS:
+            raise ValueError(f"Unknown operator: {op}")
+        condition = OPERATORS[op](data[column], value)
+        mask = condition if mask is None else mask & condition
+    return mask
@@ -1,17 +1,25 @@
 import struct
 import numpy as np
-from dataclasses import dataclass
-from typing import List, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
 from functools import cached_property
 
 @dataclass
 class ColumnSchema:
     name: str
     fmt: str  # struct format, e.g., 'q' or 'd'
+    default: Any = None  # fill value for partitions written before this column existed
+
+    @property
+    def fill_value(self) -> Any:
+        if self.default is not None:
+            return self.default
+        return np.nan if np.dtype(self.fmt).kind in "fc" else 0
 
 @dataclass
 class TableSchema:
     columns: List[ColumnSchema]
+    version: int = field(default=1)
 
     @cached_property
     def struct_format(self) -> str:
@@ -24,3 +32,50 @@ class TableSchema:
     @cached_property
     def record_size(self) -> int:
         return struct.calcsize(self.struct_format)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializable description of the schema version and layout.
+        """
+        return {
+            "version": self.version,
+            "columns": [[col.name, col.fmt] for col in self.columns],
+        }
+
+    @classmethod
+    def from_dict(cls, layout: Dict[str, Any]) -> "TableSchema":
+        return cls(
+            columns=[ColumnSchema(name, fmt) for name, fmt in layout["columns"]],
+            version=layout["version"],
+        )
+
+    def same_layout(self, other: "TableSchema") -> bool:
+        return np.dtype(self.numpy_dtype) == np.dtype(other.numpy_dtype)
+
+    def project(self, records: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Project structured records (possibly of an older layout) onto this schema.
+
+        Unchanged columns are returned as zero-copy views, columns whose type changed
+        are cast, and missing columns are filled with the column's fill value.
+        """
+        result = {}
+        fields = records.dtype.fields or {}
+        for col, (name, dtype) in zip(self.columns, self.numpy_dtype):
+            if name not in fields:
+                result[name] = np.full(len(records), col.fill_value, dtype=dtype)
+            elif fields[name][0] != dtype:
+                result[name] = records[name].astype(dtype)
+            else:
+                result[name] = records[name]
+        return result
+
+    def to_records(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Gather a dict of columns into a structured array of this layout.
+        """
+        length = len(next(iter(columns.values()))) if columns else 0
+        records = np.empty(length, dtype=self.numpy_dtype)
+        for name, _ in self.numpy_dtype:
+            records[name] = columns[name]
+        return records
@@ -1,6 +1,24 @@
+import pytest
 from chronostore.backend.flatfile.partitioner import Partitioner
 
 def test_partition_path(tmp_path):
     p = Partitioner(tmp_path)
     path = p.get_partition_path("ES", "2025-06-14")
     assert path == tmp_path / "ES" / "2025-06-14"
+
+def test_find_partition_across_tiers(tmp_path):
+    hot, cold = tmp_path / "hot", tmp_path / "cold"
+    p = Partitioner(hot, [cold])
+    (cold / "ES" / "2025-06-13").mkdir(parents=True)
+    (hot / "ES" / "2025-06-14").mkdir(parents=True)
+
+    assert p.find_partition_path("ES", "2025-06-13") == cold / "ES" / "2025-06-13"
+    assert p.find_partition_path("ES", "2025-06-15") == hot / "ES" / "2025-06-15"
+    assert p.find_tier("ES", "2025-06-13") == 1
+    assert p.find_tier("ES", "2025-06-15") == -1
+    assert p.list_partitions("ES") == ["2025-06-13", "2025-06-14"]
+
+def test_unknown_tier(tmp_path):
+    p = Partitioner(tmp_path)
+    with pytest.raises(ValueError):
+        p.get_partition_path("ES", "2025-06-14", tier=1)
@@ -20,3 +20,108 @@ def test_pack_and_read(tmp_path):
     data = storage.read_file(str(path))
     assert len(data["timestamp"]) == 5
     assert np.allclose(data["price"], [100.5]*5)
+
+def test_read_ignores_partial_record(tmp_path):
+    schema = TableSchema(columns=[
+        ColumnSchema("timestamp", "q"),
+        ColumnSchema("price", "d")
+    ])
+    backend = FlatFileBackend(schema, tmp_path)
+    storage = Storage(schema)
+    packed = backend.pack_row({"timestamp": 1, "price": 2.5})
+
+    path = tmp_path / "data.bin"
+    with open(path, "wb") as f:
+        f.write(packed * 3 + packed[:5])
+
+    data = storage.read_file(str(path))
+    assert len(data["timestamp"]) == 3
+
+def test_read_with_pending(tmp_path):
+    schema = TableSchema(columns=[
+        ColumnSchema("timestamp", "q"),
+        ColumnSchema("price", "d")
+    ])
+    backend = FlatFileBackend(schema, tmp_path)
+    storage = Storage(schema)
+    rows = [{"timestamp": i, "price": float(i)} for i in range(5)]
+
+    path = tmp_path / "data.bin"
+    with open(path, "wb") as f:
+        f.write(backend.pack_rows(rows[:3]))
+
+    pending = backend.pack_rows(rows[3:])
+    requests = []
+
+    def read_pending(offset, length):
+        requests.append((offset, length))
+        return pending[offset:offset + length]
+
+    kwargs = {"pending_size": len(pending), "read_pending": read_pending}
+    data = storage.read_file(str(path), **kwargs)
+    assert list(data["timestamp"]) == [0, 1, 2, 3, 4]
+
+    data = storage.read_file(str(path), -1, **kwargs)
+    assert list(data["timestamp"]) == [4]
+    assert requests[-1] == (16, 16)
+
+    # Slices not reaching the pending rows don't copy them
+    requests.clear()
+    data = storage.read_file(str(path), 0, 2, **kwargs)
+    assert list(data["timestamp"]) == [0, 1]
+    assert not data["timestamp"].flags.owndata
+    assert not requests
+
+def test_read_unflushed_rows(tmp_path):
+    schema = TableSchema(columns=[
+        ColumnSchema("timestamp", "q"),
+        ColumnSchema("price", "d")
+    ])
+    backend = FlatFileBackend(schema, tmp_path)
+    backend.append("ES", "2025-06-14", {"timestamp": 1, "price": 1.0})
+    backend.append("ES", "2025-06-14", {"timestamp": 2, "price": 2.0})
+
+    data = backend.read("ES", "2025-06-14")
+    assert list(data["timestamp"]) == [1, 2]
+
+    backend.flush()
+    data = backend.read("ES", "2025-06-14")
+    assert list(data["timestamp"]) == [1, 2]
+
+def test_read_legacy_layout(tmp_path):
+    legacy = TableSchema(columns=[ColumnSchema("timestamp", "q")])
+    schema = TableSchema(columns=[
+        ColumnSchema("timestamp", "q"),
+        ColumnSchema("price", "d")
+    ], version=2)
+    storage = Storage(schema, legacy)
+
+    path = tmp_path / "data.bin"
+    path.write_bytes(np.arange(4, dtype="q").tobytes())
+
+    data = storage.read_file(str(path))
+    assert list(data["timestamp"]) == [0, 1, 2, 3]
+    assert not data["timestamp"].flags.owndata
+    assert np.isnan(data["price"]).all()
+
+    storage.write_file(str(path), schema.to_records(data))
+    assert storage.read_layout(str(path)).version == 2
+    assert list(storage.read_file(str(path))["timestamp"]) == [0, 1, 2, 3]
+
+def test_read_with_small_write_buffer(tmp_path):
+    schema = TableSchema(columns=[
+        ColumnSchema("timestamp", "q"),
+        ColumnSchema("price", "d")
+    ])
+    backend = FlatFileBackend(schema, tmp_path, buffer_size=32)
+    backend.append("ES", "2025-06-14", [{"timestamp": i, "price": float(i)} for i in range(3)])
+
+    # The first rows were written out, the last one is still buffered
+    writer = next(iter(backend.open_writers.values()))
+    assert writer.snapshot()[1] == 0
+    backend.append("ES", "2025-06-14", {"timestamp": 3, "price": 3.0})
+    assert writer.snapshot()[1] == 16
+
+    data = backend.read("ES", "2025-06-14")
+    assert list(data["timestamp"]) == [0, 1, 2, 3]
+    backend.flush()
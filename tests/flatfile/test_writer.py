@@ -7,4 +7,19 @@ def test_writer_appends(tmp_path):
     w.flush()
     with open(path, "rb") as f:
         content = f.read()
-    assert content == b"abcdef"
\ No newline at end of file
+    assert content == b"abcdef"
+
+def test_writer_snapshot(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"xy")
+    w = Writer(str(path), buffer_size=4)
+    w.append(b"ab")
+    assert w.snapshot() == (2, 2)
+    assert w.read_pending(2, 1, 1) == b"b"
+    w.append(b"cd")
+    assert w.snapshot() == (6, 0)
+    assert path.read_bytes() == b"xyabcd"
+
+    # The snapshot's pending bytes were written out since, read them from file
+    assert w.read_pending(2, 0, 2) == b"ab"
+    w.flush()
@@ -0,0 +1,129 @@
+import pytest
+import numpy as np
+
+from chronostore import TimeSeriesEngine, ReadCache
+from chronostore.backend import FlatFileBackend, LmdbBackend
+
+def row(i, delta=0):
+    return {
+        "timestamp": i,
+        "open": 5400.0 + i,
+        "high": 5401.0 + i,
+        "low": 5399.0 + i,
+        "close": 5400.5 + i,
+        "volume": 100 + i,
+        "delta": delta,
+    }
+
+@pytest.fixture(params=[FlatFileBackend, LmdbBackend])
+def cached_engine(request, tmp_path, default_schema):
+    backend = request.param(default_schema, str(tmp_path), cache=ReadCache())
+    return TimeSeriesEngine(backend=backend)
+
+def test_lru_eviction_by_bytes():
+    cache = ReadCache(max_bytes=200)
+    cache.put("a", {"x": np.zeros(10)}, [("ES", "2025-06-13")])
+    cache.put("b", {"x": np.zeros(10)}, [("ES", "2025-06-14")])
+    assert cache.get("a") is not None
+
+    cache.put("c", {"x": np.zeros(10)}, [("ES", "2025-06-15")])
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+    cache.put("big", {"x": np.zeros(100)}, [("ES", "2025-06-15")])
+    assert cache.get("big") is None
+    assert cache.stats() == {"hits": 3, "misses": 2, "hit_rate": 0.6, "entries": 2, "bytes": 160}
+
+def test_invalidate_partition():
+    cache = ReadCache()
+    cache.put("day", {"x": np.zeros(2)}, [("ES", "2025-06-13")])
+    cache.put("range", {"x": np.zeros(4)}, [("ES", "2025-06-13"), ("ES", "2025-06-14")])
+    cache.put("other", {"x": np.zeros(2)}, [("ES", "2025-06-15")])
+
+    cache.invalidate("ES", "2025-06-14")
+    assert cache.get("range") is None
+    assert cache.get("day") is not None
+    assert cache.get("other") is not None
+
+def test_reads_are_read_only_with_cache(cached_engine, tmp_path, default_schema):
+    cached_engine.append("ES", "2025-06-13", [row(i, delta=i) for i in range(3)])
+    cached_engine.flush()
+
+    for where in [("delta", ">", 0), ("delta", ">", 0), lambda d: d["delta"] > 0]:
+        data = cached_engine.read("ES", "2025-06-13", where=where)
+        with pytest.raises(ValueError):
+            data["delta"][0] = 1
+
+    # Results too large to be cached are read-only too
+    cached_engine.backend.cache.max_bytes = 1
+    data = cached_engine.read("ES", ("2025-06-13", "2025-06-14"), where=("delta", ">", 0))
+    with pytest.raises(ValueError):
+        data["delta"][0] = 1
+
+    # Without a cache, filtered results stay writable
+    backend = FlatFileBackend(default_schema, str(tmp_path / "uncached"))
+    backend.append("ES", "2025-06-13", [row(i, delta=i) for i in range(3)])
+    backend.flush()
+    backend.read("ES", "2025-06-13", where=("delta", ">", 0))["delta"][0] = 1
+
+def test_cached_reads(cached_engine):
+    cached_engine.append("ES", "2025-06-13", [row(i, delta=i - 1) for i in range(3)])
+    cached_engine.flush()
+    cache = cached_engine.backend.cache
+
+    first = cached_engine.read("ES", "2025-06-13", where=("delta", ">", 0))
+    second = cached_engine.read("ES", "2025-06-13", where=("delta", ">", 0))
+    assert list(second["timestamp"]) == [2]
+    assert second["timestamp"] is first["timestamp"]
+    assert cache.stats()["hits"] == 1
+
+    result = cached_engine.read("ES", ("2025-06-13", "2025-06-14"), where=[("delta", ">=", 0), ("volume", "in", [101, 102])])
+    assert list(result["timestamp"]) == [1, 2]
+
+    # Callable filters bypass the result cache
+    hits = cache.stats()["hits"]
+    cached_engine.read("ES", "2025-06-13", where=lambda d: d["delta"] > 0)
+    cached_engine.read("ES", "2025-06-13", where=lambda d: d["delta"] > 0)
+    assert cache.stats()["hits"] == hits
+
+def test_cache_invalidated_on_write(cached_engine):
+    cached_engine.append("ES", "2025-06-13", [row(i) for i in range(3)])
+    cached_engine.append("ES", "2025-06-14", [row(i) for i in range(3)])
+    cached_engine.flush()
+
+    assert len(cached_engine.read("ES", "2025-06-13")["timestamp"]) == 3
+    assert len(cached_engine.read("ES", ("2025-06-13", "2025-06-14"))["timestamp"]) == 6
+
+    cached_engine.append("ES", "2025-06-14", row(3))
+    cached_engine.flush()
+
+    assert len(cached_engine.read("ES", ("2025-06-13", "2025-06-14"))["timestamp"]) == 7
+    assert len(cached_engine.read("ES", "2025-06-14")["timestamp"]) == 4
+
+    hits = cached_engine.backend.cache.stats()["hits"]
+    assert len(cached_engine.read("ES", "2025-06-13")["timestamp"]) == 3
+    assert cached_engine.backend.cache.stats()["hits"] == hits + 1
+
+    cached_engine.drop_partition("ES", "2025-06-13")
+    assert not cached_engine.read("ES", "2025-06-13")
+
+def test_export_bypasses_cache(cached_engine, tmp_path):
+    cached_engine.append("ES", "2025-06-13", [row(i) for i in range(3)])
+    cached_engine.flush()
+
+    cached_engine.export_parquet("ES", ("2025-06-13", "2025-06-14"), str(tmp_path / "export.parquet"))
+    assert cached_engine.backend.cache.stats()["entries"] == 0
+
+def test_stale_result_not_cached():
+    cache = ReadCache()
+    partitions = [("ES", "2025-06-13")]
+    generations = cache.generations(partitions)
+
+    # Invalidated while the result was being read
+    cache.invalidate("ES", "2025-06-13")
+    cache.put("a", {"x": np.zeros(2)}, partitions, generations)
+    assert cache.get("a") is None
+
+    cache.put("a", {"x": np.zeros(2)}, partitions, cache.generations(partitions))
+    assert cache.get("a") is not None
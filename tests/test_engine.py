@@ -1,8 +1,13 @@
+import threading
+import time
 import pytest
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
+from chronostore import TimeSeriesEngine, TableSchema, ColumnSchema
+from chronostore.backend import FlatFileBackend, LmdbBackend
+
 
 def test_append_and_read(engine):
     date_str = "2025-06-14"
@@ -107,3 +112,233 @@ def test_append_and_read_dataframe(engine):
     result_df = engine.read_dataframe("ES", day)
 
     pd.testing.assert_frame_equal(result_df, df)
+
+@pytest.mark.parametrize("backend_cls", [FlatFileBackend, LmdbBackend])
+def test_schema_evolution(tmp_path, backend_cls):
+    old_schema = TableSchema(columns=[
+        ColumnSchema("timestamp", "q"),
+        ColumnSchema("bid", "d"),
+    ], version=1)
+    new_schema = TableSchema(columns=[
+        ColumnSchema("timestamp", "q"),
+        ColumnSchema("bid", "d"),
+        ColumnSchema("ask", "d"),
+        ColumnSchema("size", "q", default=-1),
+    ], version=2)
+
+    old = backend_cls(old_schema, str(tmp_path))
+    old.append("ES", "2025-06-13", [{"timestamp": i, "bid": 1.0 + i} for i in range(3)])
+    old.flush()
+    if backend_cls is LmdbBackend:
+        old.env.close()
+
+    engine = TimeSeriesEngine(backend=backend_cls(new_schema, str(tmp_path)))
+    engine.append("ES", "2025-06-14", [{"timestamp": 10, "bid": 2.0, "ask": 2.5, "size": 7}])
+    engine.flush()
+
+    day = engine.read("ES", "2025-06-13")
+    assert list(day["bid"]) == [1.0, 2.0, 3.0]
+    assert np.isnan(day["ask"]).all()
+    assert list(day["size"]) == [-1, -1, -1]
+
+    result = engine.read("ES", ("2025-06-13", "2025-06-14"))
+    assert list(result["timestamp"]) == [0, 1, 2, 10]
+    assert list(result["size"]) == [-1, -1, -1, 7]
+
+    # Appending to an old partition migrates it first
+    engine.append("ES", "2025-06-13", {"timestamp": 3, "bid": 4.0, "ask": 4.5, "size": 1})
+    engine.flush()
+    day = engine.read("ES", "2025-06-13")
+    assert list(day["timestamp"]) == [0, 1, 2, 3]
+    assert list(day["size"]) == [-1, -1, -1, 1]
+
+def test_migrate_in_background(tmp_path):
+    old_schema = TableSchema(columns=[ColumnSchema("timestamp", "q")])
+    new_schema = TableSchema(columns=[
+        ColumnSchema("timestamp", "q"),
+        ColumnSchema("value", "d"),
+    ], version=2)
+
+    old = FlatFileBackend(old_schema, str(tmp_path))
+    old.append("ES", "2025-06-13", [{"timestamp": i} for i in range(3)])
+    old.flush()
+
+    backend = FlatFileBackend(new_schema, str(tmp_path))
+    path = str(tmp_path / "ES" / "2025-06-13" / "data.bin")
+    assert backend.storage.read_layout(path).version == 1
+
+    backend.migrate("ES", ("2025-06-12", "2025-06-13"), background=True).result()
+    assert backend.storage.read_layout(path).version == 2
+
+    data = backend.read("ES", "2025-06-13")
+    assert list(data["timestamp"]) == [0, 1, 2]
+    assert np.isnan(data["value"]).all()
+
+def test_read_arrow(engine):
+    now = int(datetime(2025, 6, 13, 9, 30).timestamp() * 1e9)
+    for day in ["2025-06-13", "2025-06-14"]:
+        for i in range(3):
+            engine.append("ES", day, {
+                "timestamp": now + i * 60_000_000_000,
+                "open": 5400.0 + i,
+                "high": 5401.0 + i,
+                "low": 5399.0 + i,
+                "close": 5400.5 + i,
+                "volume": 100 + i,
+                "delta": -50 + i
+            })
+    engine.flush()
+
+    table = engine.read_arrow("ES", ("2025-06-13", "2025-06-14"))
+    assert table.num_rows == 6
+    assert len(table.to_batches()) == 2
+    assert table.column("open").to_pylist() == [5400.0, 5401.0, 5402.0] * 2
+
+    table = engine.read_arrow("ES", ("2025-06-13", "2025-06-14"), start=-2)
+    assert table.column("volume").to_pylist() == [101, 102]
+
+    table = engine.read_arrow("ES", "2025-06-13", where=lambda d: d["delta"] > -50)
+    assert table.num_rows == 2
+
+def test_parquet_roundtrip(engine, tmp_path):
+    now = int(datetime(2025, 6, 13, 9, 30).timestamp() * 1e9)
+    for day in ["2025-06-13", "2025-06-15"]:
+        engine.append("ES", day, [{
+            "timestamp": now + i * 60_000_000_000,
+            "open": 5400.0 + i,
+            "high": 5401.0 + i,
+            "low": 5399.0 + i,
+            "close": 5400.5 + i,
+            "volume": 100 + i,
+            "delta": -50 + i
+        } for i in range(3)])
+    engine.flush()
+
+    path = str(tmp_path / "export.parquet")
+    assert engine.export_parquet("ES", ("2025-06-13", "2025-06-15"), path) == 6
+    assert engine.import_parquet("NQ", path) == 6
+
+    for day in ["2025-06-13", "2025-06-15"]:
+        expected = engine.read("ES", day)
+        result = engine.read("NQ", day)
+        for name in expected:
+            assert np.array_equal(result[name], expected[name])
+    assert not engine.read("NQ", "2025-06-14")
+
+    assert engine.import_parquet("YM", path, date="2025-06-20") == 6
+    assert len(engine.read("YM", "2025-06-20")["timestamp"]) == 6
+
+def test_append_during_background_migration(tmp_path, monkeypatch):
+    old_schema = TableSchema(columns=[ColumnSchema("timestamp", "q")])
+    new_schema = TableSchema(columns=[
+        ColumnSchema("timestamp", "q"),
+        ColumnSchema("value", "d"),
+    ], version=2)
+
+    old = FlatFileBackend(old_schema, str(tmp_path))
+    old.append("ES", "2025-06-13", [{"timestamp": i} for i in range(3)])
+    old.flush()
+
+    backend = FlatFileBackend(new_schema, str(tmp_path))
+    migrating, release = threading.Event(), threading.Event()
+    read_records = backend.storage.read_records
+
+    def slow_read_records(*args, **kwargs):
+        migrating.set()
+        release.wait(timeout=5)
+        return read_records(*args, **kwargs)
+
+    monkeypatch.setattr(backend.storage, "read_records", slow_read_records)
+    future = backend.migrate("ES", "2025-06-13", background=True)
+    assert migrating.wait(timeout=5)
+
+    appender = threading.Thread(target=backend.append, args=("ES", "2025-06-13", {"timestamp": 3, "value": 1.0}))
+    appender.start()
+    time.sleep(0.05)
+    release.set()
+    appender.join(timeout=5)
+    future.result(timeout=5)
+    backend.flush()
+
+    data = backend.read("ES", "2025-06-13")
+    assert list(data["timestamp"]) == [0, 1, 2, 3]
+    assert data["value"][3] == 1.0
+
+def test_append_records_by_name(tmp_path):
+    schema = TableSchema(columns=[ColumnSchema("t", "q"), ColumnSchema("v", "d")])
+    engine = TimeSeriesEngine(backend=FlatFileBackend(schema, str(tmp_path)))
+
+    records = np.array([(7.0, 2)], dtype=[("v", "d"), ("t", "q")])
+    engine.append("ES", "2025-06-13", records)
+    engine.flush()
+    data = engine.read("ES", "2025-06-13")
+    assert list(data["t"]) == [2]
+    assert list(data["v"]) == [7.0]
+
+    with pytest.raises(ValueError):
+        engine.append("ES", "2025-06-13", np.array([(1, 2.0)], dtype=[("x", "q"), ("y", "d")]))
+
+@pytest.mark.parametrize("date", ["2025-06-13", ("2025-06-13", "2025-06-14")])
+def test_read_arrow_matches_read(engine, date):
+    for day in ["2025-06-13", "2025-06-14"]:
+        engine.append("ES", day, [{
+            "timestamp": i,
+            "open": 5400.0 + i,
+            "high": 5401.0 + i,
+            "low": 5399.0 + i,
+            "close": 5400.5 + i,
+            "volume": 100 + i,
+            "delta": i % 2
+        } for i in range(4)])
+    engine.flush()
+
+    where = ("delta", "==", 1)
+    expected = engine.read("ES", date, where=where)
+    table = engine.read_arrow("ES", date, where=where)
+    assert table.column("timestamp").to_pylist() == list(expected["timestamp"])
+
+    # read_arrow always slices date ranges as a whole, like LmdbBackend.read
+    # (FlatFileBackend.read ignores start/end for date ranges)
+    table = engine.read_arrow("ES", date, start=1, end=-1, where=where)
+    if isinstance(date, str) or isinstance(engine.backend, LmdbBackend):
+        expected = engine.read("ES", date, start=1, end=-1, where=where)
+        assert table.column("timestamp").to_pylist() == list(expected["timestamp"])
+    else:
+        assert table.column("timestamp").to_pylist() == [1, 3, 1]
+
+def test_import_parquet_mismatched_metadata(engine, tmp_path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.table({
+        "timestamp": [1, 2, 3], "open": [1.0] * 3, "high": [1.0] * 3, "low": [1.0] * 3,
+        "close": [1.0] * 3, "volume": [1] * 3, "delta": [1] * 3,
+    }).replace_schema_metadata({"chronostore.partitions": '[["2025-07-01", 2]]'})
+    path = str(tmp_path / "mismatched.parquet")
+    pq.write_table(table, path)
+
+    with pytest.raises(ValueError):
+        engine.import_parquet("ES", path)
+    assert not engine.read("ES", "2025-07-01")
+
+def test_import_parquet_nulls(tmp_path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = TableSchema(columns=[
+        ColumnSchema("timestamp", "q"),
+        ColumnSchema("size", "q", default=-1),
+        ColumnSchema("price", "d"),
+    ])
+    path = str(tmp_path / "nulls.parquet")
+    pq.write_table(pa.table({
+        "timestamp": [1, 2],
+        "size": pa.array([5, None], type=pa.int64()),
+        "price": pa.array([None, 2.0], type=pa.float64()),
+    }), path)
+
+    backend = FlatFileBackend(schema, str(tmp_path))
+    backend.import_parquet("ES", path, date="2025-07-01")
+    data = backend.read("ES", "2025-07-01")
+    assert list(data["size"]) == [5, -1]
+    assert np.isnan(data["price"][0]) and data["price"][1] == 2.0
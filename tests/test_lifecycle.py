@@ -0,0 +1,96 @@
+import os
+import pytest
+import numpy as np
+
+from chronostore import LifecycleManager
+from chronostore.backend import FlatFileBackend, LmdbBackend
+
+DAYS = ["2025-06-10", "2025-06-11", "2025-06-12", "2025-06-13", "2025-06-14"]
+
+def fill(engine, table="ES"):
+    for n, day in enumerate(DAYS):
+        engine.append(table, day, [{
+            "timestamp": n * 10 + i,
+            "open": 5400.0 + i,
+            "high": 5401.0 + i,
+            "low": 5399.0 + i,
+            "close": np.nan if i == 0 else 5400.5 + i,
+            "volume": 100 + i,
+            "delta": -50 + i
+        } for i in range(3)])
+    engine.flush()
+
+def test_list_and_drop_partitions(engine):
+    fill(engine)
+    assert engine.list_partitions("ES") == DAYS
+
+    engine.drop_partition("ES", "2025-06-10")
+    assert engine.list_partitions("ES") == DAYS[1:]
+    assert not engine.read("ES", "2025-06-10")
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_seal_partition(engine, compress):
+    fill(engine)
+    assert engine.partition_stats("ES", "2025-06-11") is None
+
+    engine.seal_partition("ES", "2025-06-11", compress=compress)
+    stats = engine.partition_stats("ES", "2025-06-11")
+    assert stats["rows"] == 3
+    assert stats["columns"]["timestamp"] == {"min": 10, "max": 12, "nulls": 0}
+    assert stats["columns"]["close"] == {"min": 5401.5, "max": 5402.5, "nulls": 1}
+
+    data = engine.read("ES", "2025-06-11")
+    assert list(data["timestamp"]) == [10, 11, 12]
+    result = engine.read("ES", ("2025-06-10", "2025-06-12"))
+    assert len(result["timestamp"]) == 9
+
+    new_row = {"timestamp": 0, "open": 0.0, "high": 0.0, "low": 0.0, "close": 0.0, "volume": 0, "delta": 0}
+    engine.append("ES", "2025-06-12", new_row)
+    with pytest.raises(ValueError):
+        engine.append("ES", "2025-06-11", new_row)
+    engine.flush()
+
+    # Other partitions are still written after the rejected append
+    assert len(engine.read("ES", "2025-06-12")["timestamp"]) == 4
+    engine.append("ES", "2025-06-15", new_row)
+    engine.flush()
+    assert len(engine.read("ES", "2025-06-15")["timestamp"]) == 1
+    assert len(engine.read("ES", "2025-06-11")["timestamp"]) == 3
+
+def test_lifecycle_retention_and_sealing(engine):
+    fill(engine)
+    manager = LifecycleManager(engine, retention_days=3, seal_after_days=2)
+
+    actions = manager.run("ES", today="2025-06-14")
+    assert actions == {"dropped": ["2025-06-10"], "sealed": ["2025-06-11", "2025-06-12"], "moved": []}
+    assert engine.list_partitions("ES") == DAYS[1:]
+
+    actions = manager.run("ES", today="2025-06-14")
+    assert actions == {"dropped": [], "sealed": [], "moved": []}
+
+def test_lifecycle_tiering(tmp_path, default_schema):
+    hot, cold = tmp_path / "hot", tmp_path / "cold"
+    backend = FlatFileBackend(default_schema, str(hot), tier_dirs=[str(cold)])
+    fill(backend)
+
+    manager = LifecycleManager(backend, tier_after_days=3, compress=True)
+    actions = manager.run("ES", today="2025-06-14")
+    assert actions["moved"] == ["2025-06-10", "2025-06-11"]
+    assert os.path.exists(cold / "ES" / "2025-06-10" / "data.bin.z")
+    assert not os.path.exists(hot / "ES" / "2025-06-10")
+
+    assert backend.list_partitions("ES") == DAYS
+    result = backend.read("ES", ("2025-06-10", "2025-06-14"))
+    assert list(result["timestamp"][:6]) == [0, 1, 2, 10, 11, 12]
+    assert len(result["timestamp"]) == 15
+
+def test_lifecycle_rejects_tiering_without_tiers(tmp_path, default_schema):
+    with pytest.raises(ValueError):
+        LifecycleManager(LmdbBackend(default_schema, str(tmp_path)), tier_after_days=3)
+
+def test_lifecycle_rejects_unknown_cold_tier(tmp_path, default_schema):
+    backend = FlatFileBackend(default_schema, str(tmp_path))
+    with pytest.raises(ValueError):
+        LifecycleManager(backend, tier_after_days=1)
+    with pytest.raises(ValueError):
+        backend.move_partition("ES", "2025-06-10", 1)